@@ -17,7 +17,7 @@ import { api } from "../../convex/_generated/api";
 import { Id } from "../../convex/_generated/dataModel";
 import AddAlarmForm from "./AddAlarmForm";
 import AlarmItem from "./AlarmItem";
-import EyeDetectionPanel from "./EyeDetectionPanel";
+import EyeDetectionPanel, { DETECTOR_INPUT_SIZE } from "./EyeDetectionPanel";
 import QuestionChallenge from "./QuestionChallenge";
 
 declare global {
@@ -28,7 +28,9 @@ declare global {
         faceLandmark68Net: { loadFromUri: (uri: string) => Promise<void> };
       };
       TinyFaceDetectorOptions: any;
-      detectAllFaces: (video: HTMLVideoElement, options?: any) => any;
+      detectAllFaces: (input: HTMLVideoElement | HTMLCanvasElement, options?: any) => any;
+      detectSingleFace: (input: HTMLVideoElement | HTMLCanvasElement, options?: any) => any;
+      detectFaceLandmarks: (input: HTMLCanvasElement) => Promise<unknown>;
     };
   }
 }
@@ -47,6 +49,40 @@ interface Question {
   answer: string;
 }
 
+// Shared across mounts so the face-api weights are only fetched once per page
+let faceModelsPromise: Promise<void> | null = null;
+
+// Run both nets once on a blank frame so WebGL shader compilation happens at
+// page load instead of on the first detection while the alarm is ringing
+const warmUpFaceModels = async () => {
+  try {
+    const canvas = document.createElement("canvas");
+    canvas.width = DETECTOR_INPUT_SIZE;
+    canvas.height = DETECTOR_INPUT_SIZE;
+    await window.faceapi.detectAllFaces(
+      canvas,
+      new window.faceapi.TinyFaceDetectorOptions({ inputSize: DETECTOR_INPUT_SIZE })
+    );
+    await window.faceapi.detectFaceLandmarks(canvas);
+  } catch (error) {
+    console.error("Face model warm-up failed:", error);
+  }
+};
+
+const loadFaceModels = () => {
+  if (!faceModelsPromise) {
+    faceModelsPromise = Promise.all([
+      window.faceapi.nets.tinyFaceDetector.loadFromUri("/models"),
+      window.faceapi.nets.faceLandmark68Net.loadFromUri("/models"),
+    ]).then(warmUpFaceModels);
+    // Allow a retry on the next mount if loading failed
+    faceModelsPromise.catch(() => {
+      faceModelsPromise = null;
+    });
+  }
+  return faceModelsPromise;
+};
+
 export default function AlarmsPanel() {
   // Convex queries
   const alarms = useQuery(api.alarm.getAlarms) ?? [];
@@ -66,7 +102,6 @@ export default function AlarmsPanel() {
   const [alarmWaitingForMotion, setAlarmWaitingForMotion] = useState<Alarm | null>(null);
   const [motionDetected, setMotionDetected] = useState(false);
   const [isAwake, setIsAwake] = useState(false);
-  const [earValue, setEarValue] = useState(0);
   const [modelsLoaded, setModelsLoaded] = useState(false);
   const [question, setQuestion] = useState<Question | null>(null);
   const [userAnswer, setUserAnswer] = useState("");
@@ -75,26 +110,33 @@ export default function AlarmsPanel() {
   const [loadingQuestion, setLoadingQuestion] = useState(false);
 
   const audioRef = useRef<HTMLAudioElement | null>(null);
-  const videoRef = useRef<HTMLVideoElement | null>(null);
-  const detectionIntervalRef = useRef<NodeJS.Timeout | null>(null);
 
-  const EAR_THRESHOLD = 0.28;
-
-  // Fetch motion data from serial server
+  // Fetch motion data from serial server, only while an alarm is waiting for motion
   useEffect(() => {
+    if (!alarmWaitingForMotion) return;
+    let cancelled = false;
+    let timeout: NodeJS.Timeout | null = null;
+
     const fetchMotion = async () => {
       try {
         const res = await fetch('http://localhost:3001/distance');
         const data = await res.json();
-        setMotionDetected(data.motionDetected);
+        if (!cancelled) setMotionDetected(data.motionDetected);
       } catch (err) {
         console.error('Motion detection error:', err);
       }
+      // Schedule the next poll only once this one settles so slow responses never stack up
+      if (!cancelled) timeout = setTimeout(fetchMotion, 100);
     };
 
-    const interval = setInterval(fetchMotion, 100);
-    return () => clearInterval(interval);
-  }, []);
+    fetchMotion();
+    return () => {
+      cancelled = true;
+      if (timeout) clearTimeout(timeout);
+      // Don't let a stale reading dismiss the next alarm's motion check
+      setMotionDetected(false);
+    };
+  }, [alarmWaitingForMotion]);
 
   // When motion is detected and alarm is waiting, show dialog
   useEffect(() => {
@@ -104,34 +146,27 @@ export default function AlarmsPanel() {
     }
   }, [motionDetected, alarmWaitingForMotion, activeAlarm]);
 
-  // Load face detection models
-  useEffect(() => {
-    const loadModels = async () => {
-      if (!window.faceapi) {
-        console.error("face-api.js not loaded");
-        return;
-      }
-      try {
-        await window.faceapi.nets.tinyFaceDetector.loadFromUri("/models");
-        await window.faceapi.nets.faceLandmark68Net.loadFromUri("/models");
-        console.log("Face detection models loaded");
-        setModelsLoaded(true);
-      } catch (error) {
-        console.error("Error loading models:", error);
-      }
-    };
-    if (typeof window !== "undefined" && window.faceapi) {
-      loadModels();
+  // Load face detection models once face-api.js is ready (see <Script onReady> below)
+  const loadModels = async () => {
+    if (!window.faceapi) {
+      console.error("face-api.js not loaded");
+      return;
+    }
+    try {
+      await loadFaceModels();
+      console.log("Face detection models loaded");
+      setModelsLoaded(true);
+    } catch (error) {
+      console.error("Error loading models:", error);
     }
-  }, []);
+  };
 
-  // Start video and fetch question when alarm triggers
+  // Fetch question when alarm triggers; the camera is owned by EyeDetectionPanel
   useEffect(() => {
     if (activeAlarm && modelsLoaded) {
-      startVideo();
       fetchQuestion();
     } else if (!activeAlarm) {
-      stopVideo();
+      setIsAwake(false);
       setQuestion(null);
       setUserAnswer("");
       setAnswerCorrect(false);
@@ -153,72 +188,6 @@ export default function AlarmsPanel() {
     }
   };
 
-  const startVideo = () => {
-    navigator.mediaDevices
-      .getUserMedia({ video: true })
-      .then((stream) => {
-        if (videoRef.current) {
-          videoRef.current.srcObject = stream;
-          videoRef.current.play();
-          startEyeDetection();
-        }
-      })
-      .catch((err) => console.error("Camera error:", err));
-  };
-
-  const stopVideo = () => {
-    if (videoRef.current && videoRef.current.srcObject) {
-      const stream = videoRef.current.srcObject as MediaStream;
-      stream.getTracks().forEach((track) => track.stop());
-      videoRef.current.srcObject = null;
-    }
-    if (detectionIntervalRef.current) {
-      clearInterval(detectionIntervalRef.current);
-      detectionIntervalRef.current = null;
-    }
-    setIsAwake(false);
-    setEarValue(0);
-  };
-
-  const startEyeDetection = () => {
-    if (detectionIntervalRef.current) clearInterval(detectionIntervalRef.current);
-    detectionIntervalRef.current = setInterval(async () => {
-      if (!videoRef.current || !window.faceapi) return;
-      try {
-        const detections = await window.faceapi
-          .detectAllFaces(videoRef.current, new window.faceapi.TinyFaceDetectorOptions())
-          .withFaceLandmarks();
-        if (detections.length > 0) {
-          const landmarks = detections[0].landmarks;
-          const leftEye = landmarks.getLeftEye();
-          const rightEye = landmarks.getRightEye();
-          if (leftEye.length === 6 && rightEye.length === 6) {
-            const leftEAR = getEAR(leftEye);
-            const rightEAR = getEAR(rightEye);
-            const avgEAR = (leftEAR + rightEAR) / 2;
-            setEarValue(avgEAR);
-            setIsAwake(avgEAR > EAR_THRESHOLD);
-          }
-        } else {
-          setIsAwake(false);
-          setEarValue(0);
-        }
-      } catch (error) {
-        console.error("Detection error:", error);
-      }
-    }, 300);
-  };
-
-  const euclideanDistance = (p1: { x: number; y: number }, p2: { x: number; y: number }) =>
-    Math.sqrt((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2);
-
-  const getEAR = (eye: Array<{ x: number; y: number }>) => {
-    const A = euclideanDistance(eye[1], eye[5]);
-    const B = euclideanDistance(eye[2], eye[4]);
-    const C = euclideanDistance(eye[0], eye[3]);
-    return (A + B) / (2.0 * C);
-  };
-
   // Alarm loop
   useEffect(() => {
     const timer = setInterval(() => {
@@ -289,7 +258,7 @@ export default function AlarmsPanel() {
 
   return (
     <>
-      <Script src="/face-api.min.js" strategy="beforeInteractive" />
+      <Script src="/face-api.min.js" strategy="afterInteractive" onReady={loadModels} />
       <div className="min-h-screen p-6 md:p-12">
         <div className="max-w-2xl mx-auto">
           <div className="flex items-center justify-between mb-8">
@@ -376,8 +345,6 @@ export default function AlarmsPanel() {
               <EyeDetectionPanel
                 modelsLoaded={modelsLoaded}
                 isActive={!!activeAlarm}
-                earValue={earValue}
-                onEarChange={setEarValue}
                 onAwakeChange={setIsAwake}
               />
               <div
@@ -1,26 +1,44 @@
 "use client";
 
-import { useEffect, useRef } from "react";
+import { useEffect, useRef, useState } from "react";
 import { Eye } from "lucide-react";
 
 interface EyeDetectionPanelProps {
   modelsLoaded: boolean;
   isActive: boolean;
-  earValue: number;
-  onEarChange: (ear: number) => void;
   onAwakeChange: (awake: boolean) => void;
 }
 
-export default function EyeDetectionPanel({ modelsLoaded, isActive, earValue, onEarChange, onAwakeChange }: EyeDetectionPanelProps) {
+const EAR_THRESHOLD = 0.28;
+// Face fills most of the frame during an alarm, so a small detector input is enough
+export const DETECTOR_INPUT_SIZE = 224;
+// Motion gate: skip detection while the scene is still and the user was not awake
+const THUMB_WIDTH = 32;
+const THUMB_HEIGHT = 24;
+const MOTION_THRESHOLD = 4;
+const MAX_SKIPPED_TICKS = 3;
+// Detection runs at ~3 Hz on a 224px input, so a modest stream is plenty
+const VIDEO_CONSTRAINTS: MediaTrackConstraints = {
+  width: { ideal: 640 },
+  height: { ideal: 480 },
+  frameRate: { ideal: 15, max: 30 },
+};
+
+export default function EyeDetectionPanel({ modelsLoaded, isActive, onAwakeChange }: EyeDetectionPanelProps) {
   const videoRef = useRef<HTMLVideoElement | null>(null);
+  // EAR is only shown here, so keep it local to avoid re-rendering the parent every tick
+  const [earValue, setEarValue] = useState(0);
   const detectionIntervalRef = useRef<NodeJS.Timeout | null>(null);
-
-  const EAR_THRESHOLD = 0.28;
+  const detectionBusyRef = useRef(false);
+  const thumbCanvasRef = useRef<HTMLCanvasElement | null>(null);
+  const prevThumbRef = useRef<Uint8ClampedArray | null>(null);
+  const lastAwakeRef = useRef(false);
+  const skippedTicksRef = useRef(0);
 
   useEffect(() => {
     if (!isActive || !modelsLoaded) return;
     navigator.mediaDevices
-      .getUserMedia({ video: true })
+      .getUserMedia({ video: VIDEO_CONSTRAINTS })
       .then((stream) => {
         if (videoRef.current) {
           // Stop any existing stream before assigning a new one
@@ -55,35 +73,82 @@ export default function EyeDetectionPanel({ modelsLoaded, isActive, earValue, on
       clearInterval(detectionIntervalRef.current);
       detectionIntervalRef.current = null;
     }
+    prevThumbRef.current = null;
+    lastAwakeRef.current = false;
+    skippedTicksRef.current = 0;
     onAwakeChange(false);
-    onEarChange(0);
+    setEarValue(0);
+  };
+
+  // Grayscale-ish thumbnail of the current frame (green channel tracks luma closely)
+  const sampleThumbnail = (video: HTMLVideoElement) => {
+    if (!thumbCanvasRef.current) {
+      thumbCanvasRef.current = document.createElement("canvas");
+      thumbCanvasRef.current.width = THUMB_WIDTH;
+      thumbCanvasRef.current.height = THUMB_HEIGHT;
+    }
+    const ctx = thumbCanvasRef.current.getContext("2d", { willReadFrequently: true });
+    if (!ctx) return null;
+    ctx.drawImage(video, 0, 0, THUMB_WIDTH, THUMB_HEIGHT);
+    return ctx.getImageData(0, 0, THUMB_WIDTH, THUMB_HEIGHT).data;
+  };
+
+  const meanAbsDiff = (a: Uint8ClampedArray, b: Uint8ClampedArray) => {
+    let sum = 0;
+    for (let i = 1; i < a.length; i += 4) sum += Math.abs(a[i] - b[i]);
+    return sum / (a.length / 4);
+  };
+
+  const shouldSkipDetection = (video: HTMLVideoElement) => {
+    const thumb = sampleThumbnail(video);
+    const prev = prevThumbRef.current;
+    prevThumbRef.current = thumb;
+    if (!thumb || !prev || lastAwakeRef.current) return false;
+    // Always revalidate periodically so a stale "not awake" can recover
+    if (meanAbsDiff(thumb, prev) < MOTION_THRESHOLD && skippedTicksRef.current < MAX_SKIPPED_TICKS) {
+      skippedTicksRef.current++;
+      return true;
+    }
+    return false;
   };
 
   const startEyeDetection = () => {
     if (detectionIntervalRef.current) clearInterval(detectionIntervalRef.current);
+    const detectorOptions = new window.faceapi.TinyFaceDetectorOptions({ inputSize: DETECTOR_INPUT_SIZE });
     detectionIntervalRef.current = setInterval(async () => {
-      if (!videoRef.current || !window.faceapi) return;
+      // Drop the tick if the previous detection is still running instead of queueing behind it
+      if (!videoRef.current || !window.faceapi || detectionBusyRef.current) return;
+      if (shouldSkipDetection(videoRef.current)) return;
+      skippedTicksRef.current = 0;
+      detectionBusyRef.current = true;
       try {
-        const detections = await window.faceapi
-          .detectAllFaces(videoRef.current, new window.faceapi.TinyFaceDetectorOptions())
+        // Only the most confident face matters, so run the landmark net on it alone
+        const detection = await window.faceapi
+          .detectSingleFace(videoRef.current, detectorOptions)
           .withFaceLandmarks();
-        if (detections.length > 0) {
-          const landmarks = detections[0].landmarks;
+        // Detection was stopped while this frame was in flight
+        if (!detectionIntervalRef.current) return;
+        if (detection) {
+          const landmarks = detection.landmarks;
           const leftEye = landmarks.getLeftEye();
           const rightEye = landmarks.getRightEye();
           if (leftEye.length === 6 && rightEye.length === 6) {
             const leftEAR = getEAR(leftEye);
             const rightEAR = getEAR(rightEye);
             const avgEAR = (leftEAR + rightEAR) / 2;
-            onEarChange(avgEAR);
-            onAwakeChange(avgEAR > EAR_THRESHOLD);
+            lastAwakeRef.current = avgEAR > EAR_THRESHOLD;
+            setEarValue(avgEAR);
+            onAwakeChange(lastAwakeRef.current);
           }
         } else {
+          lastAwakeRef.current = false;
           onAwakeChange(false);
-          onEarChange(0);
+          setEarValue(0);
         }
       } catch (error) {
         console.error("Detection error:", error);
+      } finally {
+        detectionBusyRef.current = false;
       }
     }, 300);
   };